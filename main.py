@@ -9,36 +9,118 @@ import pandas as pd
 import numpy as np
 import random
 import re
-import nltk
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+import gc
+from functools import lru_cache
+from importlib.util import find_spec
 import warnings
 warnings.filterwarnings('ignore')
 
-# Download NLTK data
+# Optional: Aho-Corasick for scanning all keywords in one pass
 try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet', quiet=True)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Use the FAISS index (if installed) once there are this many general topics.
+# General topics are Question_ID <= 100, so the bundled data (and any dataset
+# with unique IDs in that split) never gets here. It's for datasets that change
+# how general topics are picked.
+FAISS_MIN_TOPICS = 1000
+
+# How close a topic has to be to count as a match. FAISS scores are cosines in
+# the reduced SVD space, not exact TF-IDF cosines, and SVD + HNSW top-1 can
+# disagree with the exact best topic. FAISS_MATCH_THRESHOLD is an uncalibrated
+# starting point: tune it (and check top-1 agreement) on the real data first.
+MATCH_THRESHOLD = 0.15
+FAISS_MATCH_THRESHOLD = 0.3
+
+# Whole-message greetings and goodbyes
+GREETINGS = frozenset({'hi', 'hello', 'hey', 'sup', 'yo', 'heya', 'hola'})
+EXITS = frozenset({'quit', 'exit', 'bye', 'goodbye', 'stop', 'gotta go'})
+
+def _scan_bytes(buf, kw, offs):
+    """Does any packed keyword appear in the byte buffer?"""
+    n = buf.shape[0]
+    for k in range(offs.shape[0] - 1):
+        start = offs[k]
+        m = offs[k + 1] - start
+        for i in range(n - m + 1):
+            j = 0
+            while j < m and buf[i + j] == kw[start + j]:
+                j += 1
+            if j == m:
+                return True
+    return False
+
+@lru_cache(maxsize=None)
+def _fast_scanner():
+    """Numba-compiled _scan_bytes, loaded only on request (None without Numba)"""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_scan_bytes)
+
+def _is_word_char(ch):
+    """Letter, digit or underscore"""
+    return ch.isalnum() or ch == '_'
+
+def _is_whole_word(text, start, end):
+    """Is text[start:end + 1] a whole phrase, not part of a bigger word?"""
+    return ((start == 0 or not _is_word_char(text[start - 1]))
+            and (end == len(text) - 1 or not _is_word_char(text[end + 1])))
+
+@lru_cache(maxsize=None)
+def _nlp_ready():
+    """Load NLTK (and download its data) only when first needed"""
+    import nltk
+    from nltk.stem import WordNetLemmatizer
+    
+    # Download NLTK data (only WordNet is used)
+    try:
+        nltk.data.find('corpora/wordnet')
+    except LookupError:
+        nltk.download('wordnet', quiet=True)
+    
+    return WordNetLemmatizer()
+
+@lru_cache(maxsize=100_000)
+def _lemmatize(word):
+    """Lemmatize one word (repeat words are free)"""
+    return _nlp_ready().lemmatize(word)
+
+# Text cleaner
+_CLEAN_RE = re.compile(r'[^a-zA-Z\s]')
+
+def _join_lemmas(words):
+    """Lemmatize the words long enough to count (shared by queries and corpus)"""
+    return ' '.join(_lemmatize(w) for w in words if len(w) > 2)
+
+@lru_cache(maxsize=4096)
+def preprocess(text):
+    """Clean text (repeat messages are free)"""
+    text = str(text).lower()
+    text = _CLEAN_RE.sub('', text)
+    return _join_lemmas(text.split())
 
 class MentalHealthBuddy:
-    def __init__(self, csv_path):
-        """Your friendly mental health companion"""
+    def __init__(self, csv_path, fast_scan=False):
+        """Your friendly mental health companion
+        
+        fast_scan=True uses the Numba keyword scanner for crisis checks
+        (worth it when serving lots of messages, not in the REPL).
+        """
         print("🌟 Getting ready to chat with you...")
         
-        self.df = pd.read_csv(csv_path)
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+        self.df = pd.read_csv(
+            csv_path,
+            usecols=['Question_ID', 'Questions', 'Answers'],
+            dtype={'Question_ID': np.int32, 'Questions': 'string', 'Answers': 'string'},
+            engine='pyarrow' if find_spec('pyarrow') else 'c',
+        )
+        
+        # Heavy libraries load only once we know there's data
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
         
         # Crisis keywords
         self.crisis_keywords = [
@@ -48,51 +130,246 @@ class MentalHealthBuddy:
             'wish i was dead', 'don\'t want to live', 'ready to end', 'take my life'
         ]
         
-        # Separate crisis vs regular
-        self.crisis_df = self.df[self.df['Question_ID'] > 100].copy()
-        self.general_df = self.df[self.df['Question_ID'] <= 100].copy()
+        # Crisis phrases that only count as whole words
+        self.crisis_phrases = [
+            'i want to die', 'i want to kill myself', 'i want to end it',
+            'i want to end my life', 'going to kill myself', 'going to die',
+            'going to end it', 'no point living', 'can\'t go on'
+        ]
+        phrase_re = r'\b(?:' + '|'.join(map(re.escape, self.crisis_phrases)) + r')\b'
+        
+        # One combined regex so each message is scanned once
+        self._crisis_re = re.compile(
+            '|'.join([re.escape(k) for k in self.crisis_keywords] + [phrase_re])
+        )
+        
+        # Or one Aho-Corasick pass over keywords and phrases together
+        self._crisis_automaton = None
+        if ahocorasick is not None:
+            self._crisis_automaton = ahocorasick.Automaton()
+            for keyword in self.crisis_keywords:
+                self._crisis_automaton.add_word(keyword, (len(keyword), False))
+            for phrase in self.crisis_phrases:
+                self._crisis_automaton.add_word(phrase, (len(phrase), True))
+            self._crisis_automaton.make_automaton()
+        
+        # Packed keyword table for the compiled scanner
+        self._kw_table = None
+        self._scan = _fast_scanner() if fast_scan else None
+        if fast_scan and self._scan is None:
+            # warnings are filtered off at the top, so say it out loud
+            print("⚠️ fast_scan needs Numba, which isn't installed - using the regular crisis check")
+        if self._scan is not None:
+            encoded = [k.encode() for k in self.crisis_keywords]
+            self._kw_table = (
+                np.frombuffer(b''.join(encoded), dtype=np.uint8),
+                np.cumsum([0] + [len(k) for k in encoded]).astype(np.int64),
+            )
+            self._crisis_phrase_re = re.compile(phrase_re)
         
-        # Process questions
-        self.general_df['processed'] = self.general_df['Questions'].apply(self.preprocess)
+        # Keyword buckets for picking replies
+        self.keyword_buckets = {
+            'thanks': ['thank', 'thanks', 'thx', 'appreciate'],
+            'how_are_you': ['how are you', 'how r u', 'hows it going'],
+            'lonely': ['lonely', 'alone', 'isolated', 'no friends'],
+            'sad': ['sad', 'depressed', 'down', 'hopeless'],
+            'anxious': ['anxious', 'anxiety', 'worried', 'stress', 'overwhelm'],
+            'angry': ['angry', 'mad', 'frustrated', 'pissed'],
+            'feel': ['feel', 'feeling'],
+            'help': ['help', 'what should', 'what can', 'how do i'],
+            'tired': ['tired', 'exhausted', 'drained'],
+        }
         
-        # TF-IDF
-        self.vectorizer = TfidfVectorizer(max_features=500)
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.general_df['processed'])
+        # One automaton that finds every bucket in a single scan
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for bucket, words in self.keyword_buckets.items():
+                for word in words:
+                    self._automaton.add_word(word, bucket)
+            self._automaton.make_automaton()
         
-        print(f"✨ Ready to be your support buddy! ({len(self.general_df)} topics I can help with)")
+        # Canned replies (built once, picked from on every turn)
+        self._rng = random.Random()
+        self._greet_replies = (
+            "Hey there friend! 😊 How are you doing today? Want to talk about something?",
+            "Hi! 💙 I'm here for you. What's on your mind?",
+            "Hey! So glad you're here. How are you feeling? Want to chat about anything?",
+            "Hello friend! I'm all ears. What's going on with you?",
+        )
+        self._thanks_replies = (
+            "Aw, you're so welcome! 💚 I'm always here if you need me, okay?",
+            "Of course! That's what friends are for. 😊 Take care!",
+            "Anytime! Seriously, I'm here whenever you need to talk. 💙",
+            "You got it! Remember, you're not alone in this. 💜",
+        )
+        self._how_are_you_replies = (
+            "Thanks for asking! I'm here and ready to support you. More importantly though - how are YOU doing? 😊",
+            "I'm good! But let's focus on you - how are you really feeling?",
+            "I'm doing well! But I'm more interested in you. What's going on in your world?",
+        )
+        self._lonely_openers = (
+            "I'm sorry you're feeling lonely. That really sucks. 💙 ",
+            "Loneliness is so hard. I'm here with you. ",
+            "Hey, you're not alone - I'm here. And here's what might help: ",
+        )
+        self._sad_openers = (
+            "I hear you, and I'm really sorry you're feeling this way. 💙 ",
+            "That sounds so heavy. I'm here for you. ",
+            "Ugh, that must be really tough. Let me try to help: ",
+        )
+        self._anxious_openers = (
+            "Anxiety is exhausting, I get it. 💚 ",
+            "That overwhelm is real. Let's tackle this together: ",
+            "I hear you. That anxiety must be draining. Here's what might help: ",
+        )
+        self._angry_openers = (
+            "I totally hear that frustration. ",
+            "It's okay to be angry. That's valid. ",
+            "Sounds frustrating for real. ",
+        )
+        self._default_openers = ("", "I hear you. ", "Okay so, ")
+        self._endings = (
+            " You've got this! 💪",
+            " I believe in you!",
+            " One step at a time, okay?",
+            " You're stronger than you think! ✨",
+        )
+        self._feel_replies = (
+            "I hear you. Your feelings are totally valid. Want to tell me more about what's going on? 💙",
+            "Thanks for sharing how you're feeling with me. That takes courage. Tell me more?",
+            "I'm here to listen. What's been making you feel this way?",
+        )
+        self._help_replies = (
+            "I want to help! Can you tell me a bit more about what's going on? Then I can give better advice. 😊",
+            "Let's figure this out together. What's the main thing you're struggling with?",
+            "I'm here for you! Give me some more details about your situation?",
+        )
+        self._tired_replies = (
+            "Being tired all the time is really hard. You deserve rest. What's been draining your energy?",
+            "Exhaustion is real. It sounds like you need some serious rest. Tell me more?",
+            "I hear that fatigue. Your body might be telling you something. Want to talk about it?",
+        )
+        self._fallback_replies = (
+            "I'm here to listen, friend. Want to tell me more about what's on your mind? 💙",
+            "I'm all ears! What's been going on with you?",
+            "Thanks for opening up. I want to understand better - can you share more?",
+            "I'm here for you. What's been weighing on you lately?",
+        )
+        self._farewells = (
+            "Take care of yourself, okay? I'm always here if you need me. 💙",
+            "Bye friend! Remember - you're doing better than you think. Be kind to yourself! 💚",
+            "See you later! Don't hesitate to come back anytime. You matter! 💜",
+            "Take care! You're stronger than you know. I'm here whenever you need. ✨",
+            "Bye! Remember to be gentle with yourself. You've got this! 💪💙",
+        )
+        
+        # Which bucket picks which replies, first match wins
+        self._opener_table = (
+            ('lonely', self._lonely_openers),
+            ('sad', self._sad_openers),
+            ('anxious', self._anxious_openers),
+            ('angry', self._angry_openers),
+        )
+        self._fallback_table = (
+            ('feel', self._feel_replies),
+            ('help', self._help_replies),
+            ('tired', self._tired_replies),
+        )
+        
+        # Casual rewrites, done in one regex pass. "It is important to" maps straight
+        # to the final phrase, same as the old back-to-back replaces produced.
+        self._casual_map = {
+            "It is important to": "You should definitely",
+            "It's important to": "You should definitely",
+            "It is important": "It's important",
+            "individuals": "people",
+            "We encourage": "I'd suggest",
+            "consider seeking": "talk to",
+        }
+        self._casual_re = re.compile(
+            '|'.join(re.escape(k) for k in sorted(self._casual_map, key=len, reverse=True))
+        )
+        
+        # Regular topics (IDs over 100 are crisis rows, handled by crisis_support)
+        self.general_df = self.df[self.df['Question_ID'] <= 100]
+        
+        # Process questions: same steps as preprocess, but the lower/clean/split
+        # part runs over the whole column at once
+        tokens = (
+            self.general_df['Questions'].astype(str).str.lower()
+            .str.replace(_CLEAN_RE, '', regex=True)
+            .str.split()
+        )
+        self.general_df['processed'] = [_join_lemmas(words) for words in tokens]
+        
+        # TF-IDF (hashed features, no vocabulary to build or look up). Plenty of
+        # buckets so words don't collide; rows are sparse, so it costs nothing.
+        self.vectorizer = HashingVectorizer(n_features=2**18, norm=None, alternate_sign=False)
+        counts = self.vectorizer.transform(self.general_df['processed'])
+        self.tfidf_t = TfidfTransformer().fit(counts)
+        
+        # Words the corpus never uses get zero weight, like TfidfVectorizer
+        # dropping out-of-vocabulary words (otherwise they dilute the query)
+        idf = self.tfidf_t.idf_.copy()
+        idf[counts.getnnz(axis=0) == 0] = 0
+        self.tfidf_t.idf_ = idf
+        self.tfidf_matrix = self.tfidf_t.transform(counts)
+        
+        # Plain array of answers for cheap lookups by index
+        self._answers = self.general_df['Answers'].to_numpy()
+        
+        # Rows are already L2-normalized, so a dot product is the cosine similarity
+        self._M = self.tfidf_matrix.T.tocsr()
+        
+        # Big dataset? Build an HNSW index over reduced dense vectors
+        self._svd = None
+        self._index = None
+        self._threshold = MATCH_THRESHOLD
+        if len(self.general_df) >= FAISS_MIN_TOPICS and find_spec('faiss'):
+            import faiss
+            from sklearn.decomposition import TruncatedSVD
+            from sklearn.preprocessing import normalize
+            self._svd = TruncatedSVD(n_components=128)
+            dense = normalize(self._svd.fit_transform(self.tfidf_matrix)).astype('float32')
+            self._index = faiss.IndexHNSWFlat(dense.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+            self._index.add(dense)
+            self._threshold = FAISS_MATCH_THRESHOLD
+        
+        # Only the answers and matrices are needed from here on
+        del self.df, self.general_df, self.tfidf_matrix
+        gc.collect()
+        
+        print(f"✨ Ready to be your support buddy! ({len(self._answers)} topics I can help with)")
         print("💙 Let's chat!\n")
     
-    def preprocess(self, text):
-        """Clean text"""
-        text = str(text).lower()
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        words = text.split()
-        words = [self.lemmatizer.lemmatize(w) for w in words if w and len(w) > 2]
-        return ' '.join(words)
+    def find_buckets(self, user_lower):
+        """Which keyword buckets show up in the (lowercased) text"""
+        if self._automaton is not None:
+            return {bucket for _, bucket in self._automaton.iter(user_lower)}
+        
+        return {
+            bucket for bucket, words in self.keyword_buckets.items()
+            if any(word in user_lower for word in words)
+        }
     
-    def is_crisis(self, text):
+    def is_crisis(self, text, user_lower=None):
         """Check if someone needs immediate help"""
-        text_lower = text.lower()
+        text_lower = text.lower() if user_lower is None else user_lower
         
-        # Check keywords
-        for keyword in self.crisis_keywords:
-            if keyword in text_lower:
+        if self._kw_table is not None:
+            buf = np.frombuffer(text_lower.encode(), dtype=np.uint8)
+            if self._scan(buf, *self._kw_table):
                 return True
+            return self._crisis_phrase_re.search(text_lower) is not None
         
-        # Check patterns
-        crisis_patterns = [
-            r'\bi want to (die|kill myself|end (it|my life))\b',
-            r'\bgoing to (kill myself|die|end it)\b',
-            r'\b(better off dead|no point living|can\'t go on)\b',
-            r'\bsuicide\b',
-            r'\bhurt myself\b'
-        ]
-        
-        for pattern in crisis_patterns:
-            if re.search(pattern, text_lower):
-                return True
+        if self._crisis_automaton is not None:
+            for end, (length, whole_word) in self._crisis_automaton.iter(text_lower):
+                if not whole_word or _is_whole_word(text_lower, end - length + 1, end):
+                    return True
+            return False
         
-        return False
+        return self._crisis_re.search(text_lower) is not None
     
     def crisis_support(self):
         """Immediate crisis help"""
@@ -109,145 +386,88 @@ class MentalHealthBuddy:
     def get_response(self, user_input):
         """Get friendly, supportive response"""
         
+        user_lower = user_input.lower().strip()
+        
         # Crisis check first!
-        if self.is_crisis(user_input):
+        if self.is_crisis(user_input, user_lower=user_lower):
             return self.crisis_support()
         
-        user_lower = user_input.lower().strip()
-        
         # Greetings
-        if user_lower in ['hi', 'hello', 'hey', 'sup', 'yo', 'heya', 'hola']:
-            return random.choice([
-                "Hey there friend! 😊 How are you doing today? Want to talk about something?",
-                "Hi! 💙 I'm here for you. What's on your mind?",
-                "Hey! So glad you're here. How are you feeling? Want to chat about anything?",
-                "Hello friend! I'm all ears. What's going on with you?"
-            ])
+        if user_lower in GREETINGS:
+            return self._rng.choice(self._greet_replies)
+        
+        hits = self.find_buckets(user_lower)
         
         # Thanks
-        if any(word in user_lower for word in ['thank', 'thanks', 'thx', 'appreciate']):
-            return random.choice([
-                "Aw, you're so welcome! 💚 I'm always here if you need me, okay?",
-                "Of course! That's what friends are for. 😊 Take care!",
-                "Anytime! Seriously, I'm here whenever you need to talk. 💙",
-                "You got it! Remember, you're not alone in this. 💜"
-            ])
+        if 'thanks' in hits:
+            return self._rng.choice(self._thanks_replies)
         
         # How are you
-        if any(phrase in user_lower for phrase in ['how are you', 'how r u', 'hows it going']):
-            return random.choice([
-                "Thanks for asking! I'm here and ready to support you. More importantly though - how are YOU doing? 😊",
-                "I'm good! But let's focus on you - how are you really feeling?",
-                "I'm doing well! But I'm more interested in you. What's going on in your world?"
-            ])
+        if 'how_are_you' in hits:
+            return self._rng.choice(self._how_are_you_replies)
         
         # Process input
-        processed = self.preprocess(user_input)
+        processed = preprocess(user_lower)
         
         if not processed or len(processed.split()) < 1:
             return "I'm listening! Tell me more - what's going on? 💙"
         
         # Find match
-        user_vector = self.vectorizer.transform([processed])
-        similarities = cosine_similarity(user_vector, self.tfidf_matrix)
-        best_idx = similarities.argmax()
-        best_score = similarities[0][best_idx]
+        user_vector = self.tfidf_t.transform(self.vectorizer.transform([processed]))
+        best_idx, best_score = self.best_match(user_vector)
         
         # Good match
-        if best_score > 0.15:
-            answer = self.general_df.iloc[best_idx]['Answers']
-            return self.make_friendly(answer, user_input)
+        if best_score > self._threshold:
+            answer = self._answers[best_idx]
+            return self.make_friendly(answer, user_input, hits)
         else:
             # Empathetic fallback
-            return self.empathetic_fallback(user_input)
+            return self.empathetic_fallback(user_input, hits)
+    
+    def best_match(self, user_vector):
+        """Find the closest topic and its similarity score"""
+        if self._index is not None:
+            from sklearn.preprocessing import normalize
+            query = normalize(self._svd.transform(user_vector)).astype('float32')
+            scores, ids = self._index.search(query, 1)
+            return ids[0][0], scores[0][0]
+        
+        similarities = (user_vector @ self._M).toarray()[0]
+        best_idx = similarities.argmax()
+        return best_idx, similarities[best_idx]
+    
+    def _pick_reply(self, table, hits, default):
+        """Random reply from the first bucket in the table that was hit"""
+        for bucket, replies in table:
+            if bucket in hits:
+                return self._rng.choice(replies)
+        return self._rng.choice(default)
     
-    def make_friendly(self, answer, user_input):
+    def make_friendly(self, answer, user_input, hits=None):
         """Make response super friendly"""
         
         # Add friendly openers based on emotion
-        user_lower = user_input.lower()
-        
-        if any(word in user_lower for word in ['lonely', 'alone', 'isolated', 'no friends']):
-            openers = [
-                "I'm sorry you're feeling lonely. That really sucks. 💙 ",
-                "Loneliness is so hard. I'm here with you. ",
-                "Hey, you're not alone - I'm here. And here's what might help: "
-            ]
-        elif any(word in user_lower for word in ['sad', 'depressed', 'down', 'hopeless']):
-            openers = [
-                "I hear you, and I'm really sorry you're feeling this way. 💙 ",
-                "That sounds so heavy. I'm here for you. ",
-                "Ugh, that must be really tough. Let me try to help: "
-            ]
-        elif any(word in user_lower for word in ['anxious', 'anxiety', 'worried', 'stress', 'overwhelm']):
-            openers = [
-                "Anxiety is exhausting, I get it. 💚 ",
-                "That overwhelm is real. Let's tackle this together: ",
-                "I hear you. That anxiety must be draining. Here's what might help: "
-            ]
-        elif any(word in user_lower for word in ['angry', 'mad', 'frustrated', 'pissed']):
-            openers = [
-                "I totally hear that frustration. ",
-                "It's okay to be angry. That's valid. ",
-                "Sounds frustrating for real. "
-            ]
-        else:
-            openers = ["", "I hear you. ", "Okay so, "]
+        if hits is None:
+            hits = self.find_buckets(user_input.lower())
         
-        response = random.choice(openers) + answer
+        response = self._pick_reply(self._opener_table, hits, self._default_openers) + answer
         
         # Make more casual
-        response = response.replace("It is important", "It's important")
-        response = response.replace("It's important to", "You should definitely")
-        response = response.replace("individuals", "people")
-        response = response.replace("We encourage", "I'd suggest")
-        response = response.replace("consider seeking", "talk to")
+        response = self._casual_re.sub(lambda m: self._casual_map[m.group(0)], response)
         
         # Add encouraging endings sometimes
-        if len(response) < 200 and random.random() > 0.6:
-            endings = [
-                " You've got this! 💪",
-                " I believe in you!",
-                " One step at a time, okay?",
-                " You're stronger than you think! ✨"
-            ]
-            response += random.choice(endings)
+        if len(response) < 200 and self._rng.random() > 0.6:
+            response += self._rng.choice(self._endings)
         
         return response
     
-    def empathetic_fallback(self, user_input):
+    def empathetic_fallback(self, user_input, hits=None):
         """When no match, still be supportive"""
         
-        user_lower = user_input.lower()
-        
-        if any(word in user_lower for word in ['feel', 'feeling']):
-            return random.choice([
-                "I hear you. Your feelings are totally valid. Want to tell me more about what's going on? 💙",
-                "Thanks for sharing how you're feeling with me. That takes courage. Tell me more?",
-                "I'm here to listen. What's been making you feel this way?"
-            ])
-        
-        elif any(word in user_lower for word in ['help', 'what should', 'what can', 'how do i']):
-            return random.choice([
-                "I want to help! Can you tell me a bit more about what's going on? Then I can give better advice. 😊",
-                "Let's figure this out together. What's the main thing you're struggling with?",
-                "I'm here for you! Give me some more details about your situation?"
-            ])
-        
-        elif any(word in user_lower for word in ['tired', 'exhausted', 'drained']):
-            return random.choice([
-                "Being tired all the time is really hard. You deserve rest. What's been draining your energy?",
-                "Exhaustion is real. It sounds like you need some serious rest. Tell me more?",
-                "I hear that fatigue. Your body might be telling you something. Want to talk about it?"
-            ])
+        if hits is None:
+            hits = self.find_buckets(user_input.lower())
         
-        else:
-            return random.choice([
-                "I'm here to listen, friend. Want to tell me more about what's on your mind? 💙",
-                "I'm all ears! What's been going on with you?",
-                "Thanks for opening up. I want to understand better - can you share more?",
-                "I'm here for you. What's been weighing on you lately?"
-            ])
+        return self._pick_reply(self._fallback_table, hits, self._fallback_replies)
     
     def chat(self):
         """Super friendly chat interface"""
@@ -276,15 +496,8 @@ class MentalHealthBuddy:
                     continue
                 
                 # Exit
-                if user_input.lower() in ['quit', 'exit', 'bye', 'goodbye', 'stop', 'gotta go']:
-                    farewells = [
-                        "Take care of yourself, okay? I'm always here if you need me. 💙",
-                        "Bye friend! Remember - you're doing better than you think. Be kind to yourself! 💚",
-                        "See you later! Don't hesitate to come back anytime. You matter! 💜",
-                        "Take care! You're stronger than you know. I'm here whenever you need. ✨",
-                        "Bye! Remember to be gentle with yourself. You've got this! 💪💙"
-                    ]
-                    print(f"\n🤖 Friend: {random.choice(farewells)}\n")
+                if user_input.lower() in EXITS:
+                    print(f"\n🤖 Friend: {self._rng.choice(self._farewells)}\n")
                     print("=" * 70)
                     break
                 